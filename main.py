@@ -1,7 +1,11 @@
+import logging
 import sys
 
 from scraper import WikipediaScraper
 
+# Show the scraper progress messages on stdout, per-page details are only logged at debug level
+logging.basicConfig(level = logging.INFO, format = "%(message)s", stream = sys.stdout)
+
 try:
     scraper = WikipediaScraper()
     scraper.get_leaders_data()
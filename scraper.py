@@ -1,105 +1,426 @@
 import json
+import os
 import re
+import contextlib
+import copy
 import csv
-from urllib.parse import urljoin
+import functools
+import logging
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+log = logging.getLogger(__name__)
+
+# Patterns used to clean the Wikipedia paragraphs, compiled once at import time.
+# Deletions are fused into a single alternation so the paragraph is scanned once for all of them:
+#   - things like "/xyzⓘ; ", "(xyzⓘ)", "[xyzⓘ", "xyzⓘ "
+#   - simple reference markers like [1], [a], etc.
+_DELETE_RE = re.compile(r"\/.*?ⓘ; ?|\(.*?ⓘ\)|\[.*?ⓘ|.*?ⓘ |\[\w\]")
+
+# Same deletions, specialized for paragraphs without any "ⓘ " or without any "ⓘ" at all.
+# The "xyzⓘ " alternative is tried (and scans to the end of the line) at every position, so
+# it makes the cleaning quadratic on long paragraphs where it can never match.
+_DELETE_WITHOUT_LISTEN_SPACE_RE = re.compile(r"\/.*?ⓘ; ?|\(.*?ⓘ\)|\[.*?ⓘ|\[\w\]")
+_DELETE_WITHOUT_LISTEN_RE = re.compile(r"\[\w\]")
+
+# Cases where there is extra information inside the parenthesis that we want to preserve
+_PAREN_SLASH_RE = re.compile(r"\(\/.*?;")
+_PAREN_LISTEN_RE = re.compile(r"\(.*?ⓘ;")
+
+# XPath queries used to find the first paragraph of a Wikipedia page, compiled once at import time.
+_MAIN_CONTENT_CLASSES = (
+    'contains(concat(" ", normalize-space(@class), " "), " mw-content-ltr ")'
+    ' or contains(concat(" ", normalize-space(@class), " "), " mw-content-rtl ")'
+)
+
+# Whether an element is the (outermost) main content <div>
+_IS_MAIN_CONTENT_XPATH = etree.XPath(
+    f"boolean(self::div[{_MAIN_CONTENT_CLASSES}][not(ancestor::div[{_MAIN_CONTENT_CLASSES}])])"
+)
+
+# Whether a paragraph is inside the main content <div>
+_IN_MAIN_CONTENT_XPATH = etree.XPath(f"boolean(ancestor::div[{_MAIN_CONTENT_CLASSES}])")
+
+# Block elements that can hold a lot of content, like the infobox table or lists. Paragraphs inside
+# them are still considered as they're parsed, and each one is emptied once finished to keep the tree small.
+_DISCARDED_TAGS = ("table", "ul", "ol", "dl")
+
+
+class CookieExpiredError(Exception):
+    """
+    Raised when the API rejects a request because its cookie expired.
+    """
 
 
 def api_call_with_cookie_retry(api_call):
     """
     Decorator that retries an API call when a cookie expired error occurs.
 
-    This decorator wraps an API call function and attempts to handle `requests.exceptions.HTTPError` 
-    (with error code 403 -> cookie expired), by fetching a new cookie and retrying the call.
+    This decorator wraps an API call function and attempts to handle `CookieExpiredError`,
+    by fetching a new cookie and retrying the call once.
+    If the new cookie is rejected too, the error is raised.
 
     Parameters:
-        api_call (callable): The API function to decorate. It must accept a self reference,
-                             followed by any additional arguments.
+        api_call (callable): The API function to decorate. It must accept a self reference
+                             (with `cookie` and `refresh_cookie`), followed by any additional arguments.
 
     Returns:
         callable: A wrapped function that retries the API call with a refreshed cookie if needed.
     """
+    @functools.wraps(api_call)
     def wrapper(self, *args, **kwargs):
+        # Get a cookie first if there's none yet, so the call isn't rejected for sure
+        self.ensure_cookie()
+
+        # Remember which cookie the call is using, in case it turns out to be expired
+        cookie = self.cookie
+
+        try:
+            return api_call(self, *args, **kwargs)
+        except CookieExpiredError:
+            pass
+
+        log.debug("Cookie expired, getting another one from the jar")
+        self.refresh_cookie(expired_cookie = cookie)
 
-        for _ in range(2):
-            try:
-                return api_call(self, *args, **kwargs)
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 403:
-                    print("Cookie expired, getting another one from the jar")
-                    self.refresh_cookie()
-                else:
-                    # For other error codes, we re-raise the exception so it bubbles up
-                    raise
+        # Retry with the new cookie, if it's rejected too the error bubbles up
+        return api_call(self, *args, **kwargs)
 
     return wrapper
 
 
 class WikipediaScraper:
-    # API base URL and endpoints
+    # API base URL and endpoint URLs
     API_BASE_URL = "https://country-leaders.onrender.com"
-    COOKIE_ENDPOINT = "/cookie"
-    COUNTRIES_ENDPOINT = "/countries"
-    LEADERS_ENDPOINT = "/leaders"
+    COOKIE_URL = API_BASE_URL + "/cookie"
+    COUNTRIES_URL = API_BASE_URL + "/countries"
+    LEADERS_URL = API_BASE_URL + "/leaders"
+
+    # Status code returned by the API when the cookie expired
+    STATUS_CODE_EXPIRED_COOKIE = 403
+
+    # Default number of concurrent Wikipedia fetches
+    MAX_WORKERS = 32
+
+    # Number of hosts to keep connection pools for: the API and the Wikipedia of each language
+    POOL_HOSTS = 16
+
+    # Server errors worth retrying after a short backoff
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+    # Seconds to wait to connect to a server, and then for its response, before giving up.
+    # The response timeout is generous, as the API can take a minute to wake up from a cold start.
+    REQUEST_TIMEOUT = (10, 90)
+
+    # Identifies the scraper to the servers, as requested by the Wikimedia User-Agent policy
+    USER_AGENT = (
+        "wikipedia-scraper/1.0 (https://github.com/albertopd/wikipedia-scraper) "
+        f"python-requests/{requests.__version__}"
+    )
 
-    def __init__(self) -> None:
+    # Size of the chunks in which the Wikipedia pages are read and parsed
+    WIKI_CHUNK_SIZE = 64 * 1024
+
+    # File where the Wikipedia intros are cached between runs, and for how many seconds they stay valid
+    WIKI_CACHE_FILE = "wiki_cache.json"
+    WIKI_CACHE_EXPIRE_AFTER = 24 * 60 * 60
+
+    # File where the API responses (countries and leaders) can be cached between runs, and for how many seconds they stay valid.
+    # Meant for development runs, so the cache is only used when passed explicitly as api_cache_file.
+    API_CACHE_FILE = "api_cache.json"
+    API_CACHE_EXPIRE_AFTER = 24 * 60 * 60
+
+    # Size of the write buffer of the output files
+    WRITE_BUFFER_SIZE = 1024 * 1024
+
+    # File where the API cookie is kept between runs
+    COOKIE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "wikipedia-scraper", "cookies.json")
+
+    def __init__(
+            self,
+            max_workers: int = MAX_WORKERS,
+            wiki_cache_file: str | None = WIKI_CACHE_FILE,
+            api_cache_file: str | None = None,
+            cookie_file: str | None = COOKIE_FILE
+        ) -> None:
+        """
+        Args:
+            max_workers (int): Number of Wikipedia pages fetched concurrently.
+            wiki_cache_file (str | None): Path of the Wikipedia intros cache, or None to disable it.
+            api_cache_file (str | None): Path of the API responses cache (e.g. API_CACHE_FILE), or None to always
+                get live data from the API.
+            cookie_file (str | None): Path where the API cookie is kept between runs, or None to disable it.
+        """
+        self.max_workers = max_workers
+        self.wiki_cache_file = wiki_cache_file
+        self.api_cache_file = api_cache_file
+        self.cookie_file = cookie_file
+        self.wiki_cache = self.load_cache(wiki_cache_file, "intro", self.WIKI_CACHE_EXPIRE_AFTER)
+        self.api_cache = self.load_cache(api_cache_file, "data", self.API_CACHE_EXPIRE_AFTER)
         self.session = requests.Session()
+
+        # Keep one pooled connection alive per worker and host, and retry on connection and server errors.
+        # Once out of retries the last response is returned, so raise_for_status() reports it as usual.
+        # Responses are compressed with brotli (when installed) or gzip, both decoded transparently.
+        adapter = HTTPAdapter(
+            pool_connections = self.POOL_HOSTS,
+            pool_maxsize = max_workers,
+            max_retries = Retry(
+                total = 3,
+                backoff_factor = 0.3,
+                status_forcelist = self.RETRY_STATUS_CODES,
+                raise_on_status = False
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Headers sent along with every request
+        self.session.headers["User-Agent"] = self.USER_AGENT
+
+        # Detect expired cookies on every API response, before the API methods see them
+        self.session.hooks["response"].append(self.check_cookie_expired)
+
+        # Last API cookie received. The session sends it along with every API call,
+        # and it's shared by all the threads and only refreshed by one of them at a time.
+        # The lock is reentrant, as ensure_cookie() refreshes the cookie while holding it.
+        self.cookie = None
+        self.cookie_lock = threading.RLock()
+
         self.leaders_data = {}
 
     def get_leaders_data(self) -> None:
         """
         Function to retrieve and enrich leaders data for all countries.
         """
-        self.refresh_cookie()
+        # Reuse the cookie of a previous run if there's one. Otherwise a new one is only
+        # requested by the first API call that isn't cached, if it expired the API calls will refresh it.
+        self.load_cookie()
 
         # Get list of countries from the API
         countries = self.get_countries()
-        print(f"Countries: {countries}")
-        
-        for country in countries:
-            print(f"Processing country: {country}")
+        log.info("Countries: %s", countries)
+
+        try:
+            with ThreadPoolExecutor(max_workers = self.max_workers) as executor:
+                # Get list of leaders of every country from the API, concurrently
+                for country, leaders in zip(countries, executor.map(self.get_leaders_per_country, countries)):
+                    self.leaders_data[country] = leaders
+
+                    log.info("%s leaders found for country %s", len(leaders), country)
+
+                # Save the API responses now, so they're kept even if fetching the Wikipedia pages fails
+                self.save_cache(self.api_cache, self.api_cache_file)
+
+                # For each leader, get the extra info from Wikipedia, also concurrently.
+                # Some leaders share the same page, so each distinct page is only fetched once.
+                leaders = [leader for country_leaders in self.leaders_data.values() for leader in country_leaders]
+                urls = list(dict.fromkeys(leader["wikipedia_url"] for leader in leaders))
+                intros = dict(zip(urls, executor.map(self.get_first_wiki_paragraph, urls)))
+
+                for leader in leaders:
+                    leader["wikipedia_intro"] = intros[leader["wikipedia_url"]]
+
+        finally:
+            # Save the intros fetched so far even if a page failed, so a rerun can skip them
+            self.save_cache(self.wiki_cache, self.wiki_cache_file)
 
-            # Get list of country leaders from the API
-            self.leaders_data[country] = self.get_leaders_per_country(country)
+    def load_cache(self, cache_file: str | None, data_key: str, expire_after: float) -> dict[str, dict]:
+        """
+        Load a cache saved by previous runs, dropping the expired and incomplete entries.
+
+        Args:
+            cache_file (str | None): Path of the cache file, or None if the cache is disabled.
+            data_key (str): Key of the cached data in each entry.
+            expire_after (float): Number of seconds the entries stay valid.
+
+        Returns:
+            dict[str, dict]: Cache entries (each one with its data and "timestamp") keyed by URL.
+        """
+        if not cache_file or not os.path.exists(cache_file):
+            return {}
 
-            print(f"{len(self.leaders_data[country])} leaders found for country {country}")
+        now = time.time()
 
-            # For each leader, get the extra info from Wikipedia
-            for leader in self.leaders_data[country]:
-                print(f"Leader Wikipage: {leader["wikipedia_url"]}")
+        try:
+            with open(cache_file, encoding = "utf-8") as file:
+                cache = json.load(file)
+
+            # A cache file that isn't shaped as expected is discarded like an unreadable one
+            return {
+                url: entry for url, entry in cache.items()
+                if data_key in entry and now - entry["timestamp"] < expire_after
+            }
+
+        except Exception as e:
+            log.warning("Failed to load cache, starting with an empty one: %s => Error: %s", cache_file, e)
+            return {}
+
+    def save_cache(self, cache: dict[str, dict], cache_file: str | None) -> None:
+        """
+        Save a cache so the next runs can skip the requests already made.
 
-                leader["wikipedia_intro"] = self.get_first_wiki_paragraph(leader["wikipedia_url"])
+        The cache is written to a temporary file first and then moved over the previous one,
+        so an interrupted run never leaves a truncated cache behind.
+
+        Args:
+            cache (dict[str, dict]): Cache entries keyed by URL.
+            cache_file (str | None): Path of the cache file, or None if the cache is disabled.
+        """
+        if not cache_file:
+            return
+
+        temp_file = cache_file + ".tmp"
+
+        try:
+            with open(temp_file, "w", encoding = "utf-8") as file:
+                json.dump(cache, file, ensure_ascii = False)
+
+            os.replace(temp_file, cache_file)
+
+        except Exception as e:
+            log.warning("Failed to save cache: %s => Error: %s", cache_file, e)
+
+            # Don't leave the half-written temporary file behind
+            with contextlib.suppress(OSError):
+                os.remove(temp_file)
     
-    def refresh_cookie(self) -> None:
+    def refresh_cookie(self, expired_cookie: requests.cookies.RequestsCookieJar | None = None) -> None:
+        """
+        Request a new session cookie from the API. The session keeps it in its cookie jar.
+
+        Only one thread refreshes the cookie at a time. If the expired cookie was already
+        replaced by another thread in the meantime, no new cookie is requested.
+
+        Args:
+            expired_cookie (RequestsCookieJar, optional): The cookie rejected by the API.
+        """
+        with self.cookie_lock:
+            if expired_cookie is not None and self.cookie is not expired_cookie:
+                return
+
+            cookie_response = self.session.get(
+                self.COOKIE_URL,
+                timeout = self.REQUEST_TIMEOUT
+            )
+            cookie_response.raise_for_status()
+            self.cookie = cookie_response.cookies
+
+            self.save_cookie()
+
+    def ensure_cookie(self) -> None:
         """
-        Request a new session cookie from the API.
+        Request a session cookie from the API if there's none yet.
+
+        Only one thread requests it, the others wait for it and then reuse it.
         """
-        cookie_response = self.session.get(urljoin(self.API_BASE_URL, self.COOKIE_ENDPOINT))
-        cookie_response.raise_for_status()
-        self.cookie = cookie_response.cookies
+        with self.cookie_lock:
+            if self.cookie is None:
+                self.refresh_cookie()
+
+    def check_cookie_expired(self, response: requests.Response, *args, **kwargs) -> None:
+        """
+        Session response hook that raises `CookieExpiredError` when the API rejects the cookie.
+
+        Args:
+            response (requests.Response): The response received by the session.
+
+        Raises:
+            CookieExpiredError: If the response is an API response with the expired cookie status code.
+        """
+        # A refused /cookie request isn't an expired cookie, raise_for_status() reports it as is
+        if (
+            response.status_code == self.STATUS_CODE_EXPIRED_COOKIE
+            and response.url.startswith(self.API_BASE_URL)
+            and not response.url.startswith(self.COOKIE_URL)
+        ):
+            # Read the (small) error body so the connection can go back to the pool
+            response.content
+            raise CookieExpiredError(f"Cookie rejected by the API => {response.url}")
+
+    def load_cookie(self) -> bool:
+        """
+        Load the API cookie saved by a previous run into the session.
+
+        Returns:
+            bool: True if a cookie that hasn't expired was loaded, False otherwise.
+        """
+        if not self.cookie_file or not os.path.exists(self.cookie_file):
+            return False
+
+        try:
+            with open(self.cookie_file, encoding = "utf-8") as cookie_file:
+                saved_cookies = json.load(cookie_file)
+
+            cookie = requests.cookies.RequestsCookieJar()
+            for saved_cookie in saved_cookies:
+                cookie.set(**saved_cookie)
+
+        except Exception as e:
+            log.warning("Failed to load API cookie, getting another one from the jar: %s => Error: %s", self.cookie_file, e)
+            return False
+
+        cookie.clear_expired_cookies()
+        if not cookie:
+            return False
+
+        self.session.cookies.update(cookie)
+        self.cookie = cookie
+
+        return True
+
+    def save_cookie(self) -> None:
+        """
+        Save the current API cookie so the next runs can skip requesting a new one.
+        """
+        if not self.cookie_file:
+            return
+
+        # Keep the domain and path, so the cookie is only ever sent to the API
+        saved_cookies = [
+            {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+                "expires": cookie.expires,
+                "secure": cookie.secure
+            }
+            for cookie in self.cookie
+        ]
+
+        try:
+            cookie_dir = os.path.dirname(self.cookie_file)
+            if cookie_dir:
+                os.makedirs(cookie_dir, exist_ok = True)
+
+            with open(self.cookie_file, "w", encoding = "utf-8") as cookie_file:
+                json.dump(saved_cookies, cookie_file)
+
+        except Exception as e:
+            log.warning("Failed to save API cookie: %s => Error: %s", self.cookie_file, e)
 
-    @api_call_with_cookie_retry
     def get_countries(self) -> list[str]:
         """
-        Retrieve a list of countries from the API, retrying on cookie expiration.
+        Retrieve a list of countries from the API, or take it from the cache if still valid.
 
         Returns:
             list[str]: List of country codes.
         """
-        countries_response = self.session.get(
-            urljoin(self.API_BASE_URL, self.COUNTRIES_ENDPOINT),
-            cookies = self.cookie
-        )
-        countries_response.raise_for_status()
-
-        return countries_response.json()
+        return self.get_api_data(self.COUNTRIES_URL)
 
-    @api_call_with_cookie_retry
     def get_leaders_per_country(self, country_code: str) -> list[dict]:
         """
-        Get leaders for a specified country from the API, retrying on cookie expiration.
+        Get leaders for a specified country from the API, or take them from the cache if still valid.
 
         Args:
             country_code (str): The ISO country code.
@@ -107,21 +428,54 @@ class WikipediaScraper:
         Returns:
             list[dict]: A list of leader records as dictionaries.
         """
-        leaders_response = self.session.get(
-            urljoin(self.API_BASE_URL, self.LEADERS_ENDPOINT), 
-            cookies = self.cookie,
-            params = {"country": country_code}
-        )
-        leaders_response.raise_for_status()
+        log.debug("Processing country: %s", country_code)
+
+        return self.get_api_data(self.LEADERS_URL, params = {"country": country_code})
+
+    def get_api_data(self, url: str, params: dict | None = None) -> list:
+        """
+        Get the JSON data of an API endpoint, or take it from the cache if still valid.
+
+        Args:
+            url (str): URL of the API endpoint.
+            params (dict, optional): Query parameters of the request.
+
+        Returns:
+            list: The decoded JSON response.
+        """
+        cache_key = f"{url}?{urlencode(params)}" if params else url
+        cache_entry = self.api_cache.get(cache_key)
+
+        if not cache_entry or time.time() - cache_entry["timestamp"] >= self.API_CACHE_EXPIRE_AFTER:
+            cache_entry = {"data": self.fetch_api_data(url, params), "timestamp": time.time()}
+            self.api_cache[cache_key] = cache_entry
+
+        # Hand out a copy, so enriching the leaders doesn't change the cached responses
+        return copy.deepcopy(cache_entry["data"])
+
+    @api_call_with_cookie_retry
+    def fetch_api_data(self, url: str, params: dict | None = None) -> list:
+        """
+        Request the JSON data of an API endpoint, retrying on cookie expiration.
+
+        Args:
+            url (str): URL of the API endpoint.
+            params (dict, optional): Query parameters of the request.
+
+        Returns:
+            list: The decoded JSON response.
+        """
+        api_response = self.session.get(url, params = params, timeout = self.REQUEST_TIMEOUT)
+        api_response.raise_for_status()
 
-        return leaders_response.json()
+        return api_response.json()
 
     def get_first_wiki_paragraph(
             self,
             wikipedia_url: str
         ) -> str:
         """
-        Extract the first relevant paragraph from a Wikipedia page.
+        Extract the first relevant paragraph from a Wikipedia page, or take it from the cache if still valid.
 
         Args:
             wikipedia_url (str): URL of the Wikipedia page.
@@ -129,44 +483,145 @@ class WikipediaScraper:
         Returns:
             str: The cleaned first paragraph of the main content.
         """
-        wiki_response = self.session.get(wikipedia_url)
-        wiki_response.raise_for_status()
+        cache_entry = self.wiki_cache.get(wikipedia_url)
 
-        soup = BeautifulSoup(wiki_response.content, 'html.parser')
+        if cache_entry and time.time() - cache_entry["timestamp"] < self.WIKI_CACHE_EXPIRE_AFTER:
+            return cache_entry["intro"]
 
-        # Try to find main content using known class names
-        # First we search by classs "mw-content-ltr"
-        main_content = soup.find("div", class_ = "mw-content-ltr")
+        log.debug("Leader Wikipage: %s", wikipedia_url)
 
-        # If not found, then we search by class "mw-content-rtl"
-        if not main_content:
-            print("Didn't find main content by class [mw-content-ltr], searching by class [mw-content-rtl]")
-            main_content = soup.find("div", class_ = "mw-content-rtl")
+        with self.session.get(wikipedia_url, stream = True, timeout = self.REQUEST_TIMEOUT) as wiki_response:
+            wiki_response.raise_for_status()
 
-        if main_content:
-            # Get all the pragraphs from the main content section
-            paragraphs = main_content.find_all("p")
-        else:
-            # As fallback, we get all the pragraphs from the page
-            paragraphs = soup.find_all("p")
-    
-        print(f"Number of paragraphs found: {len(paragraphs)}")
+            # Only trust the encoding if the server declared it, requests otherwise guesses ISO-8859-1
+            # for any HTML page, and lxml does better detecting it from the page itself.
+            content_type = wiki_response.headers.get("Content-Type", "")
+            encoding = wiki_response.encoding if "charset" in content_type.lower() else None
+
+            chunks = wiki_response.iter_content(self.WIKI_CHUNK_SIZE)
+            first_paragraph = self.parse_first_paragraph(chunks, encoding)
+
+            # Read the rest of the page without parsing it, so the connection can go back to the pool
+            for _ in chunks:
+                pass
+
+        self.wiki_cache[wikipedia_url] = {"intro": first_paragraph, "timestamp": time.time()}
+
+        return first_paragraph
+
+    def parse_first_paragraph(self, chunks: Iterable[bytes], encoding: str | None = None) -> str:
+        """
+        Parse the HTML of a Wikipedia page as it arrives and extract its first relevant paragraph.
+
+        Parsing stops as soon as the first paragraph of the main content is found, or the
+        main content ends without one, leaving the remaining chunks unread.
+
+        Args:
+            chunks (Iterable[bytes]): Chunks of the HTML page.
+            encoding (str | None): Encoding of the HTML page, or None to detect it from the page.
 
-        for paragraph in paragraphs:
-            # Look for a <b> tag in the paragraph
-            b_tag = paragraph.find("b")
+        Returns:
+            str: The cleaned first paragraph of the main content.
+        """
+        # As fallback, we keep the first paragraph found outside of the main content
+        fallback_paragraph = ""
+
+        for element in self.iter_elements(chunks, encoding):
+            if element.tag == "div":
+                # The whole main content was parsed and no first paragraph was found in it
+                return ""
+
+            paragraph = self.get_paragraph_text(element)
+
+            if not paragraph:
+                continue
+
+            if _IN_MAIN_CONTENT_XPATH(element):
+                # Clean the content of the paragraph before returning it
+                return self.clean_paragraph(paragraph)
+
+            if not fallback_paragraph:
+                fallback_paragraph = paragraph
+
+        # The page has no main content section, so we use the fallback
+        return self.clean_paragraph(fallback_paragraph)
+
+    def get_paragraph_text(self, paragraph: etree._Element) -> str:
+        """
+        Get the text of a paragraph if it looks like the first paragraph of a Wikipedia page.
+
+        Args:
+            paragraph (etree._Element): The <p> element.
+
+        Returns:
+            str: The raw paragraph text, or an empty string if it's not a first paragraph.
+        """
+        # Look for a <b> tag in the paragraph
+        b_tag = paragraph.find(".//b")
+
+        if b_tag is None:
+            return ""
+
+        # If the <b> tag is not empty and it's not the only text inside the paragraph,
+        # then we assume that we found a reliable first paragraph
+        b_tag_text = "".join(b_tag.itertext()).strip()
+        p_tag_text = "".join(paragraph.itertext())
+
+        if b_tag_text == "" or len(b_tag_text) == len(p_tag_text.strip()):
+            return ""
+
+        return p_tag_text
+
+    def iter_elements(self, chunks: Iterable[bytes], encoding: str | None = None) -> Iterator[etree._Element]:
+        """
+        Incrementally parse an HTML page and yield each <p> element and the main content <div>
+        once they're complete.
+
+        Complete tables and lists are emptied on the fly, so the tree only keeps what's needed
+        to find the first paragraph.
+
+        Args:
+            chunks (Iterable[bytes]): Chunks of the HTML page.
+            encoding (str | None): Encoding of the HTML page, or None to detect it from the page.
+
+        Yields:
+            etree._Element: The parsed elements, in the order they are completed.
+        """
+        try:
+            parser = etree.HTMLPullParser(events = ("end",), tag = ("p", "div") + _DISCARDED_TAGS, encoding = encoding)
+        except LookupError:
+            # Unknown encoding name, let lxml detect it from the page instead
+            parser = etree.HTMLPullParser(events = ("end",), tag = ("p", "div") + _DISCARDED_TAGS)
+
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from self.read_elements(parser)
+
+        try:
+            parser.close()
+        except etree.XMLSyntaxError:
+            # Empty page, nothing else to yield
+            return
 
-            # If we find the <b> tag and is not empty and it's not the only tag inside the paragraph, 
-            # then we assume that we found a reliable first paragraph
-            if b_tag:
-                b_tag_text = b_tag.get_text().rstrip()
-                p_tag_text = paragraph.get_text().rstrip()
+        yield from self.read_elements(parser)
 
-                if b_tag_text != "" and len(b_tag_text) != len(p_tag_text):
-                    # Clean the content of the paragraph before returning it
-                    return self.clean_paragraph(p_tag_text)
-                
-        return ""
+    def read_elements(self, parser: etree.HTMLPullParser) -> Iterator[etree._Element]:
+        """
+        Yield the <p> elements and the main content <div> completed by the parser so far,
+        emptying the discarded ones.
+
+        Args:
+            parser (etree.HTMLPullParser): The parser being fed with the HTML page.
+
+        Yields:
+            etree._Element: The parsed elements, in the order they are completed.
+        """
+        for _, element in parser.read_events():
+            if element.tag in _DISCARDED_TAGS:
+                # Keep the tail, it's text of the parent element
+                element.clear(keep_tail = True)
+            elif element.tag == "p" or _IS_MAIN_CONTENT_XPATH(element):
+                yield element
 
     def clean_paragraph(self, paragraph: str) -> str:
         """
@@ -180,45 +635,47 @@ class WikipediaScraper:
         """
         if not paragraph:
             return ""
-        
-        patterns_replacements = [
-            # Remove things like "/xyzⓘ; ", "(xyzⓘ)", "[xyzⓘ", "xyzⓘ "
-            { "pattern": r"(\/.*?ⓘ; ?|\(.*?ⓘ\)|\[.*?ⓘ|.*?ⓘ )", "replacement": "" },
 
-            # Remove other cases where there is extra information inside the parenthesis that we want to preserve
-            { "pattern": r"\(\/.*?;", "replacement": "(" },
-            { "pattern": r"\(.*?ⓘ;", "replacement": "(" },
-
-            # Remove simple reference markers like [1], [a], etc.
-            { "pattern": r"\[\w\]", "replacement": "" }
-        ]
+        # Use the cheapest deletions that can still match in this paragraph
+        if "ⓘ" not in paragraph:
+            delete_re = _DELETE_WITHOUT_LISTEN_RE
+        elif "ⓘ " not in paragraph:
+            delete_re = _DELETE_WITHOUT_LISTEN_SPACE_RE
+        else:
+            delete_re = _DELETE_RE
 
-        cleaned_paragraph = paragraph
+        cleaned_paragraph = delete_re.sub("", paragraph)
+        cleaned_paragraph = _PAREN_SLASH_RE.sub("(", cleaned_paragraph)
 
-        for pr in patterns_replacements:
-            cleaned_paragraph = re.sub(pr["pattern"], pr["replacement"], cleaned_paragraph)
+        if "ⓘ" in cleaned_paragraph:
+            cleaned_paragraph = _PAREN_LISTEN_RE.sub("(", cleaned_paragraph)
 
         return cleaned_paragraph.strip()
 
-    def to_json_file(self, filepath: str) -> None:
+    def to_json_file(self, filepath: str, pretty: bool = True) -> None:
         """
         Save the leader data dictionary to a JSON file.
 
         Args:
             filepath (str): Path where the JSON file will be saved.
+            pretty (bool): Whether to indent the JSON for humans, or write it compact
+                           (smaller and faster) for other programs.
         """
-        try:
-            # Serializing object to JSON string
-            json_object = json.dumps(self.leaders_data, indent = 4)
+        if pretty:
+            format_options = {"indent": 4}
+        else:
+            format_options = {"separators": (",", ":")}
 
-            # Writing serialized string to file
-            with open(filepath, "w") as outfile:
-                outfile.write(json_object)
+        try:
+            # Serialize the data straight into the file, without building the whole JSON string first.
+            # Non-ASCII characters are written as they are instead of as \uXXXX escapes.
+            with open(filepath, "w", encoding = "utf-8", buffering = self.WRITE_BUFFER_SIZE) as outfile:
+                json.dump(self.leaders_data, outfile, ensure_ascii = False, **format_options)
 
-            print(f"Leaders data saved as JSON file: {filepath}")
+            log.info("Leaders data saved as JSON file: %s", filepath)
 
         except Exception as e:
-            print(f"Failed to save leaders data to JSON file: Error: {filepath} => {e}")
+            log.error("Failed to save leaders data to JSON file: Error: %s => %s", filepath, e)
 
     def to_csv_file(self, filepath: str) -> None:
         """
@@ -228,24 +685,30 @@ class WikipediaScraper:
             filepath (str): Path where the CSV file will be saved.
         """
         try:
-            # Flatten the data and add the country info
-            rows = []
-            for country, leaders in self.leaders_data.items():
-                for leader in leaders:
-                    row = leader.copy()
-                    row['Country'] = country
-                    rows.append(row)
-
-            # Get all the fieldnames (keys)
-            fieldnames = ['Country'] + [key for key in rows[0] if key != 'Country']
+            # Get all the fieldnames (keys) used by any leader, in the order they are first seen
+            leader_keys = list(dict.fromkeys(
+                key
+                for leaders in self.leaders_data.values()
+                for leader in leaders
+                for key in leader
+                if key != 'Country'
+            ))
+
+            # Flatten the data and add the country info, one row at a time while writing.
+            # Each row is a plain list of values in the fieldnames order, missing values are left empty.
+            rows = (
+                [country] + [leader.get(key, '') for key in leader_keys]
+                for country, leaders in self.leaders_data.items()
+                for leader in leaders
+            )
 
             # Write to CSV
-            with open('leaders.csv', mode='w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
+            with open(filepath, mode='w', newline='', encoding='utf-8', buffering=self.WRITE_BUFFER_SIZE) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(['Country'] + leader_keys)
                 writer.writerows(rows)
 
-            print(f"Leaders data saved as CSV file: {filepath}")
+            log.info("Leaders data saved as CSV file: %s", filepath)
             
         except Exception as e:
-            print(f"Failed to save leaders data to CSV file: {filepath} => Error: {e}")
\ No newline at end of file
+            log.error("Failed to save leaders data to CSV file: %s => Error: %s", filepath, e)
\ No newline at end of file